@@ -0,0 +1,39 @@
+// Scrape helpers injected into every page via BrowserContext.add_init_script
+// (see _new_context in main.py). main.py calls them through page.evaluate so
+// each extraction is a single round trip and the selectors live in one place.
+(() => {
+    const PIN = /\bPIN\b\s*([\d.]+)/i;
+    const PRC_LINK = /Property\s+Record\s+Card/i;
+    const TAX_BILLS_LINK = /Tax\s+Bills/i;
+    // Deed is often a link with text like "2972 / 328"
+    const DEED_LINK = /^\s*\d+\s*\/\s*\d+\s*$/;
+
+    const textOf = el => el.innerText || el.textContent || "";
+    const hrefOf = a => (a && a.getAttribute("href") ? a.href : null);
+
+    // MapGeo details panel -> PropertyLinks fields (minus address)
+    function details() {
+        const anchors = [...document.querySelectorAll("a")].filter(a => a.getClientRects().length > 0);
+        const find = re => anchors.find(a => re.test(textOf(a)));
+
+        const pin = PIN.exec(document.body.innerText);
+        const deed = find(DEED_LINK);
+        return {
+            pin: pin ? pin[1].trim() : null,
+            prc_url: hrefOf(find(PRC_LINK)),
+            tax_bills_url: hrefOf(find(TAX_BILLS_LINK)),
+            deed_url: hrefOf(deed),
+            deed_book_page: deed ? textOf(deed).trim() : null,
+        };
+    }
+
+    // Tax bill search results: [row text, first link href] for every row
+    function taxBillRows(rows) {
+        return rows.map(r => {
+            const a = r.querySelector("a");
+            return [r.innerText.trim(), a ? a.getAttribute("href") : null];
+        });
+    }
+
+    Object.defineProperty(window, "__iredell", { value: { details, taxBillRows } });
+})();
@@ -1,20 +1,163 @@
 import asyncio
 import io
+import logging
+import os
 import re
 import zipfile
+from contextlib import asynccontextmanager
 from dataclasses import dataclass
-from typing import Optional, Dict
+from pathlib import Path
+from typing import AsyncIterator, Optional, Dict, Tuple
 
+from cachetools import TTLCache
 from fastapi import FastAPI, Form, HTTPException
 from fastapi.responses import HTMLResponse, StreamingResponse
 
-from playwright.async_api import async_playwright, Page
+from playwright.async_api import async_playwright, Browser, BrowserContext, Page, Route
+from playwright.async_api import Error as PWError, TimeoutError as PWTimeout
 
 
 IREDell_MAPGEO_URL = "https://iredellcountync.mapgeo.io/datasets/properties"
 DEFAULT_TIMEOUT_MS = 45_000
+POOL_SIZE = int(os.getenv("POOL_SIZE", "4"))
+MAX_USES_PER_CONTEXT = int(os.getenv("MAX_USES_PER_CONTEXT", "50"))
+CACHE_TTL_SECONDS = int(os.getenv("CACHE_TTL_SECONDS", str(24 * 3600)))
+CACHE_MAX_BYTES = int(os.getenv("CACHE_MAX_BYTES", str(256 * 1024 * 1024)))
+
+# Extractor helpers installed into every page of every pooled context
+_EXTRACT_JS = (Path(__file__).parent / "extract.js").read_text(encoding="utf-8")
+
+_RE_UNSAFE = re.compile(r"[^\w\s\-\.]")
+_RE_WS = re.compile(r"\s+")
+_RE_ADDR_LINK = re.compile(r"^\s*\d+\s+.+", re.I)
+_RE_ADDR_ROW = re.compile(r"\b\d+\s+\w+", re.I)
+_RE_YEAR = re.compile(r"\b(20\d{2})\b")
+_RE_ORIGIN = re.compile(r"^(https?://[^/]+)")
 
 app = FastAPI(title="Iredell Property Docs Downloader")
+log = logging.getLogger(__name__)
+
+# Shared Playwright driver + Chromium, launched once per process.
+# Requests borrow a pre-warmed BrowserContext from a bounded pool; past
+# POOL_SIZE concurrent requests they queue instead of oversubscribing Chromium.
+_browser_lock = asyncio.Lock()
+
+
+@app.on_event("startup")
+async def _startup() -> None:
+    app.state.pw = await async_playwright().start()
+    app.state.browser = await app.state.pw.chromium.launch(headless=True)
+
+    app.state.ctx_sem = asyncio.Semaphore(POOL_SIZE)
+    app.state.ctx_pool = asyncio.Queue()
+    app.state.ctx_uses = {}
+    app.state.mapgeo_pages = {}
+    for _ in range(POOL_SIZE):
+        app.state.ctx_pool.put_nowait(await _new_context())
+
+
+@app.on_event("shutdown")
+async def _shutdown() -> None:
+    pool = getattr(app.state, "ctx_pool", None)
+    while pool is not None and not pool.empty():
+        context = pool.get_nowait()
+        if context is not None:
+            try:
+                await context.close()
+            except PWError:
+                pass
+
+    browser = getattr(app.state, "browser", None)
+    if browser is not None:
+        try:
+            await browser.close()
+        except PWError:
+            pass
+    pw = getattr(app.state, "pw", None)
+    if pw is not None:
+        await pw.stop()
+
+
+async def _get_browser() -> Browser:
+    """
+    Return the shared browser, relaunching it if Chromium has crashed or disconnected.
+    """
+    browser = getattr(app.state, "browser", None)
+    if browser is not None and browser.is_connected():
+        return browser
+
+    async with _browser_lock:
+        browser = getattr(app.state, "browser", None)
+        if browser is not None and browser.is_connected():
+            return browser
+        if getattr(app.state, "pw", None) is None:
+            app.state.pw = await async_playwright().start()
+        app.state.browser = await app.state.pw.chromium.launch(headless=True)
+        return app.state.browser
+
+
+async def _new_context() -> BrowserContext:
+    browser = await _get_browser()
+    context = await browser.new_context(accept_downloads=True)
+    await context.add_init_script(script=_EXTRACT_JS)
+    return context
+
+
+@asynccontextmanager
+async def _checkout_context() -> AsyncIterator[BrowserContext]:
+    """
+    Borrow a context from the pool and return it afterwards.
+    Contexts are recycled after MAX_USES_PER_CONTEXT uses or if their browser died.
+    """
+    async with app.state.ctx_sem:
+        context: Optional[BrowserContext] = await app.state.ctx_pool.get()
+        try:
+            if context is None or not context.browser.is_connected():
+                if context is not None:
+                    app.state.ctx_uses.pop(context, None)
+                    app.state.mapgeo_pages.pop(context, None)
+                context = await _new_context()
+            yield context
+        finally:
+            replacement = context
+            try:
+                if context is not None:
+                    uses = app.state.ctx_uses.pop(context, 0) + 1
+                    if uses >= MAX_USES_PER_CONTEXT or not context.browser.is_connected():
+                        app.state.mapgeo_pages.pop(context, None)
+                        # Leave a hole until a new context exists; the next checkout
+                        # creates one lazily if we fail or get cancelled first
+                        replacement = None
+                        try:
+                            await context.close()
+                        except PWError:
+                            pass
+                        try:
+                            replacement = await _new_context()
+                        except PWError:
+                            log.warning("could not replace recycled browser context", exc_info=True)
+                    else:
+                        app.state.ctx_uses[context] = uses
+            finally:
+                # Always give the slot back, or the pool shrinks for good
+                app.state.ctx_pool.put_nowait(replacement)
+
+
+async def _get_mapgeo_page(context: BrowserContext) -> Page:
+    """
+    Each pooled context keeps one long-lived tab for the MapGeo search flow.
+    It is never navigated anywhere else; document fetches use sibling pages.
+    Between searches it is parked on about:blank so the SPA isn't left running.
+    """
+    page = app.state.mapgeo_pages.get(context)
+    if page is None or page.is_closed():
+        page = await context.new_page()
+        page.set_default_timeout(DEFAULT_TIMEOUT_MS)
+        # Only this page is filtered: the deed, PRC and tax bill pages are printed
+        # and need their images.
+        await page.route("**/*", _block_heavy_resources)
+        app.state.mapgeo_pages[context] = page
+    return page
 
 
 @dataclass
@@ -27,10 +170,43 @@ class PropertyLinks:
     deed_book_page: Optional[str] = None
 
 
+# Per-address caches keyed by _cache_key(). Links let a cold ZIP rebuild skip the
+# MapGeo search; docs are bounded by total PDF size rather than entry count.
+# Cache reads/writes never await, so no lock is needed on the event loop.
+_links_cache: "TTLCache[str, PropertyLinks]" = TTLCache(maxsize=512, ttl=CACHE_TTL_SECONDS)
+_docs_cache: "TTLCache[str, Dict[str, bytes]]" = TTLCache(
+    maxsize=CACHE_MAX_BYTES,
+    ttl=CACHE_TTL_SECONDS,
+    getsizeof=lambda files: sum(len(data) for data in files.values()),
+)
+
+
+def _timeout(what: str) -> None:
+    log.debug("timed out waiting for %s", what)
+
+
+def _cache_key(address: str) -> str:
+    return _safe_filename(address.lower())
+
+
 def _safe_filename(s: str) -> str:
-    s = re.sub(r"[^\w\s\-\.]", "", s).strip()
-    s = re.sub(r"\s+", "_", s)
-    return s[:120] if len(s) > 120 else s
+    s = _RE_UNSAFE.sub("", s).strip()
+    return _RE_WS.sub("_", s)[:120]
+
+
+_BLOCKED_RESOURCE_TYPES = {"image", "media", "font"}
+_BLOCKED_HOSTS = ("google-analytics.com", "googletagmanager.com", "doubleclick.net")
+
+
+async def _block_heavy_resources(route: Route) -> None:
+    """
+    Drop map tiles, images, fonts and analytics we never read during the MapGeo search.
+    """
+    request = route.request
+    if request.resource_type in _BLOCKED_RESOURCE_TYPES or any(h in request.url for h in _BLOCKED_HOSTS):
+        await route.abort()
+    else:
+        await route.continue_()
 
 
 async def _wait_for_mapgeo_ready(page: Page) -> None:
@@ -43,16 +219,11 @@ async def _search_address_on_mapgeo(page: Page, address: str) -> None:
     search = page.locator('input[placeholder*="Quick Search"]')
     await search.wait_for(state="visible", timeout=DEFAULT_TIMEOUT_MS)
 
-    # Clear + type + press Enter
-    await search.click()
-    await search.fill("")
-    await search.type(address, delay=25)
+    # Set the value in one go (fill fires the input event) + press Enter.
+    # No wait here: _open_first_result_details waits for the results/details.
+    await search.fill(address)
     await search.press("Enter")
 
-    # Give MapGeo time to populate results / update UI
-    await page.wait_for_timeout(1500)
-
-
 
 async def _open_first_result_details(page: Page) -> None:
     """
@@ -61,28 +232,35 @@ async def _open_first_result_details(page: Page) -> None:
     - If that fails, try clicking the first item in a list-like panel
     - Finally, verify we got the details panel by waiting for "PIN"
     """
-    # Sometimes MapGeo auto-opens details; check first
+    pin_label = page.locator("text=PIN").first
+    address_link = page.locator("a").filter(has_text=_RE_ADDR_LINK).first
+
+    # Sometimes MapGeo auto-opens details. Wait for whichever shows up first --
+    # the details panel or a result to click -- instead of a fixed 6 s probe.
     try:
-        await page.wait_for_selector("text=PIN", timeout=6_000)
+        await pin_label.or_(address_link).first.wait_for(state="visible", timeout=12_000)
+    except PWTimeout:
+        _timeout("MapGeo details or result link")
+    if await pin_label.is_visible():
         return
-    except:
-        pass
 
     # Try clicking the first address-looking link (most reliable clickable target)
-    address_link = page.locator("a").filter(
-        has_text=re.compile(r"^\s*\d+\s+.+", re.I)
-    ).first
-
     try:
         await address_link.wait_for(state="visible", timeout=12_000)
         await address_link.click(timeout=12_000)
-    except:
+        clicked = True
+    except PWTimeout:
+        _timeout("MapGeo address link")
+        clicked = False
+    except PWError:
+        log.debug("clicking MapGeo address link failed", exc_info=True)
+        clicked = False
+
+    if not clicked:
         # Fallback: click first row-like element that contains an address pattern
-        row = page.locator("div").filter(
-            has_text=re.compile(r"\b\d+\s+\w+", re.I)
-        ).first
-        await row.wait_for(state="visible", timeout=12_000)
-        await row.click(timeout=12_000)
+        row = page.locator("div").filter(has_text=_RE_ADDR_ROW).first
+        await row.wait_for(state="visible", timeout=5_000)
+        await row.click(timeout=5_000)
 
     # After clicking a result, wait for details panel
     await page.wait_for_selector("text=PIN", timeout=DEFAULT_TIMEOUT_MS)
@@ -91,37 +269,28 @@ async def _open_first_result_details(page: Page) -> None:
 
 
 async def _extract_property_links_from_details(page: Page, address: str) -> PropertyLinks:
-    links = PropertyLinks(address=address)
+    return PropertyLinks(address=address, **await page.evaluate("window.__iredell.details()"))
 
-    body_text = await page.locator("body").inner_text()
 
-    # Try to capture PIN value next to PIN label
-    pin_match = re.search(r"\bPIN\b\s*([\d\.]+)", body_text, flags=re.I)
-    if pin_match:
-        links.pin = pin_match.group(1).strip()
-
-    async def href_for_link_text(pattern: str) -> Optional[str]:
-        loc = page.locator("a").filter(has_text=re.compile(pattern, re.I)).first
-        try:
-            if await loc.is_visible(timeout=2_500):
-                return await loc.get_attribute("href")
-        except:
-            return None
+async def _download_pdf_via_http(page: Page, url: str) -> Optional[bytes]:
+    """
+    Fetch url directly over HTTP if it serves a PDF, skipping the renderer.
+    Uses the context's request API so cookies stay in (and are shared with) that
+    context, including across redirects.
+    Returns None for anything else so callers can fall back to the browser.
+    """
+    try:
+        resp = await page.context.request.get(url, timeout=20_000)
+    except PWError:
+        log.debug("direct fetch of %s failed", url, exc_info=True)
         return None
-
-    links.prc_url = await href_for_link_text(r"Property\s+Record\s+Card")
-    links.tax_bills_url = await href_for_link_text(r"Tax\s+Bills")
-
-    # Deed is often a link with text like "2972 / 328"
     try:
-        deed_anchor = page.locator("a").filter(has_text=re.compile(r"^\s*\d+\s*/\s*\d+\s*$")).first
-        if await deed_anchor.is_visible(timeout=2_500):
-            links.deed_book_page = (await deed_anchor.inner_text()).strip()
-            links.deed_url = await deed_anchor.get_attribute("href")
-    except:
-        pass
-
-    return links
+        content_type = resp.headers.get("content-type", "")
+        if resp.status != 200 or "application/pdf" not in content_type.lower():
+            return None
+        return await resp.body()
+    finally:
+        await resp.dispose()
 
 
 async def _download_via_browser_download(page: Page, url: str) -> Optional[bytes]:
@@ -129,24 +298,48 @@ async def _download_via_browser_download(page: Page, url: str) -> Optional[bytes
     Try to trigger an actual browser download and return the file bytes.
     """
     try:
-        async with page.expect_download(timeout=20_000) as dl_info:
-            await page.goto(url, wait_until="domcontentloaded")
+        async with page.expect_download(timeout=10_000) as dl_info:
+            try:
+                await page.goto(url, wait_until="domcontentloaded")
+            except PWError:
+                # Chromium aborts the navigation once the response turns into a download
+                pass
         download = await dl_info.value
         path = await download.path()
         if path:
-            return path.read_bytes()
-    except:
+            # Don't block the event loop on a multi-MB disk read
+            return await asyncio.to_thread(path.read_bytes)
+    except PWTimeout:
+        _timeout(f"download from {url}")
+        return None
+    except PWError:
+        log.debug("download from %s failed", url, exc_info=True)
         return None
     return None
 
 
-async def _print_page_to_pdf(page: Page, url: str, landscape: bool = True) -> bytes:
-    await page.goto(url, wait_until="networkidle")
-    await page.wait_for_timeout(750)
+async def _print_page_to_pdf(
+    page: Page,
+    url: str,
+    landscape: bool = True,
+    ready_selector: Optional[str] = None,
+    print_background: bool = True,
+    prefer_css_page_size: bool = False,
+) -> bytes:
+    # networkidle can hang on lingering analytics beacons; wait for load + fonts instead
+    await page.goto(url, wait_until="domcontentloaded")
+    await page.wait_for_load_state("load")
+    await page.evaluate("document.fonts ? document.fonts.ready.then(() => true) : true")
+    if ready_selector:
+        try:
+            await page.wait_for_selector(ready_selector, timeout=10_000)
+        except PWTimeout:
+            _timeout(f"{ready_selector!r} on {url}")
     pdf_bytes = await page.pdf(
         format="Letter",
         landscape=landscape,
-        print_background=True,
+        print_background=print_background,
+        prefer_css_page_size=prefer_css_page_size,
         margin={"top": "0.25in", "bottom": "0.25in", "left": "0.25in", "right": "0.25in"},
     )
     return pdf_bytes
@@ -156,45 +349,33 @@ async def _try_get_latest_tax_bill_url(page: Page, tax_bills_url: str) -> str:
     await page.goto(tax_bills_url, wait_until="domcontentloaded")
     await page.wait_for_load_state("networkidle")
 
-    # If there is a Search button, click it to populate results
-    for btn_text in ["Search", "SEARCH"]:
-        btn = page.locator(f'input[type="submit"][value="{btn_text}"], button:has-text("{btn_text}")').first
+    # If there is a Search button, click it once to populate results
+    btn = page.locator('input[type="submit"][value="Search" i], button:has-text("Search")').first
+    if await btn.is_visible():
+        rows_before = await page.locator("tr").count()
+        await btn.click()
+        # Rows that were already on the page don't count as results
         try:
-            if await btn.is_visible(timeout=2_000):
-                await btn.click()
-                await page.wait_for_timeout(800)
-                break
-        except:
-            pass
+            await page.wait_for_function(
+                "n => document.querySelectorAll('tr').length !== n", arg=rows_before, timeout=10_000
+            )
+        except PWTimeout:
+            _timeout("tax bill results")
+        except PWError:
+            log.debug("waiting for tax bill results on %s failed", page.url, exc_info=True)
 
-    # Try pick most recent year row with a link
-    rows = page.locator("tr")
-    n = await rows.count()
-    year_re = re.compile(r"\b(20\d{2})\b")
+    # Try pick most recent year row with a link; read every row in one round trip
+    rows = await page.locator("tr").evaluate_all("rows => window.__iredell.taxBillRows(rows)")
 
     best_year = -1
     best_href = None
 
-    for i in range(n):
-        r = rows.nth(i)
-        try:
-            txt = (await r.inner_text()).strip()
-        except:
-            continue
-        m = year_re.search(txt)
+    for txt, href in rows:
+        m = _RE_YEAR.search(txt)
         if not m:
             continue
         year = int(m.group(1))
-        if year < best_year:
-            continue
-
-        a = r.locator("a").first
-        try:
-            href = await a.get_attribute("href")
-        except:
-            href = None
-
-        if href:
+        if year >= best_year and href:
             best_year = year
             best_href = href
 
@@ -202,7 +383,7 @@ async def _try_get_latest_tax_bill_url(page: Page, tax_bills_url: str) -> str:
         if best_href.startswith("http"):
             return best_href
         if best_href.startswith("/"):
-            origin = re.match(r"^(https?://[^/]+)", page.url)
+            origin = _RE_ORIGIN.match(page.url)
             if origin:
                 return origin.group(1) + best_href
 
@@ -210,66 +391,178 @@ async def _try_get_latest_tax_bill_url(page: Page, tax_bills_url: str) -> str:
     return page.url
 
 
-async def fetch_docs_as_zip(address: str) -> bytes:
-    """
-    Returns ZIP bytes containing available PDFs.
-    """
-    async with async_playwright() as p:
-        browser = await p.chromium.launch(headless=True)
-        context = await browser.new_context(accept_downloads=True)
-        page = await context.new_page()
-        page.set_default_timeout(DEFAULT_TIMEOUT_MS)
+async def _fetch_deed(page: Page, deed_url: str) -> Optional[bytes]:
+    deed_bytes = await _download_pdf_via_http(page, deed_url)
+    if deed_bytes is None:
+        deed_bytes = await _download_via_browser_download(page, deed_url)
+    if deed_bytes is None:
+        # Sometimes deed opens in viewer; print it
+        try:
+            deed_bytes = await _print_page_to_pdf(page, deed_url, landscape=False)
+        except PWError:
+            log.debug("printing deed %s failed", deed_url, exc_info=True)
+            deed_bytes = None
+    return deed_bytes
+
 
-        # 1) Open MapGeo and search
-        await page.goto(IREDell_MAPGEO_URL, wait_until="domcontentloaded")
-        await _wait_for_mapgeo_ready(page)
-        await _search_address_on_mapgeo(page, address)
-        await _open_first_result_details(page)
+async def _fetch_property_record_card(page: Page, prc_url: str) -> bytes:
+    return await _print_page_to_pdf(page, prc_url, landscape=True, ready_selector="table")
 
-        # 2) Extract links
-        links = await _extract_property_links_from_details(page, address)
 
-        files: Dict[str, bytes] = {}
+async def _fetch_latest_tax_bill(page: Page, tax_bills_url: str) -> bytes:
+    bill_url = await _try_get_latest_tax_bill_url(page, tax_bills_url)
+    # The bill site has a full-page background image that bloats the PDF; its own @page
+    # rules (if any) know the bill layout better than our Letter default
+    return await _print_page_to_pdf(
+        page, bill_url, landscape=False, print_background=False, prefer_css_page_size=True
+    )
+
+
+# Strong refs to detached cleanup tasks so they aren't garbage-collected mid-run
+_background_tasks = set()
+
+
+async def _close_pages(pages) -> None:
+    for page in pages:
+        try:
+            await page.close()
+        except PWError:
+            pass
+
+
+async def _run_fetch(name: str, fetch, page: Page, url: str) -> Tuple[str, Optional[bytes]]:
+    try:
+        return name, await fetch(page, url)
+    except Exception:
+        log.warning("fetching %s failed", name, exc_info=True)
+        return name, None
+
+
+async def _scrape_docs(address: str) -> AsyncIterator[Tuple[str, Optional[bytes]]]:
+    """
+    Yields (filename, PDF bytes) for each document as soon as its fetch finishes;
+    bytes is None when that document could not be retrieved.
+    """
+    key = _cache_key(address)
 
-        # 3) Deed
+    async with _checkout_context() as context:
+        links = _links_cache.get(key)
+        if links is None:
+            page = await _get_mapgeo_page(context)
+            try:
+                # 1) Open MapGeo and search. Always re-navigate so a details panel
+                # left over from the previous address can't be mistaken for this one.
+                await page.goto(IREDell_MAPGEO_URL, wait_until="domcontentloaded")
+                await _wait_for_mapgeo_ready(page)
+                await _search_address_on_mapgeo(page, address)
+                await _open_first_result_details(page)
+
+                # 2) Extract links
+                links = await _extract_property_links_from_details(page, address)
+
+                # Park the tab until the next search re-navigates it
+                await page.goto("about:blank")
+            except Exception:
+                # Don't hand a half-finished tab to the next request
+                await page.close()
+                raise
+            # A PIN alone would pin this address to a 404 for the whole TTL
+            if links.deed_url or links.prc_url or links.tax_bills_url:
+                _links_cache[key] = links
+
+        # 3) Deed, property record card and latest tax bill, fetched
+        # concurrently on sibling pages so the MapGeo tab is left alone
+        jobs = []
         if links.deed_url:
-            deed_bytes = await _download_via_browser_download(page, links.deed_url)
-            if deed_bytes is None:
-                # Sometimes deed opens in viewer; print it
-                try:
-                    deed_bytes = await _print_page_to_pdf(page, links.deed_url, landscape=False)
-                except:
-                    deed_bytes = None
-            if deed_bytes:
-                files["deed.pdf"] = deed_bytes
-
-        # 4) Property record card (print to PDF)
+            jobs.append(("deed.pdf", _fetch_deed, links.deed_url))
         if links.prc_url:
-            try:
-                files["property_record_card.pdf"] = await _print_page_to_pdf(page, links.prc_url, landscape=True)
-            except:
-                pass
-
-        # 5) Tax bill (latest)
+            jobs.append(("property_record_card.pdf", _fetch_property_record_card, links.prc_url))
         if links.tax_bills_url:
-            try:
-                bill_url = await _try_get_latest_tax_bill_url(page, links.tax_bills_url)
-                files["tax_bill.pdf"] = await _print_page_to_pdf(page, bill_url, landscape=False)
-            except:
-                pass
+            jobs.append(("tax_bill.pdf", _fetch_latest_tax_bill, links.tax_bills_url))
 
-        await context.close()
-        await browser.close()
+        doc_pages = []
+        tasks = []
+        try:
+            for name, fetch, url in jobs:
+                doc_page = await context.new_page()
+                doc_page.set_default_timeout(DEFAULT_TIMEOUT_MS)
+                doc_pages.append(doc_page)
+                tasks.append(asyncio.create_task(_run_fetch(name, fetch, doc_page, url)))
+
+            # Hand each PDF on as it finishes so zipping/streaming overlaps the rest
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            # Client may have gone away mid-stream. That disconnect cancels every
+            # await in here, so close the pages in a shielded task that finishes
+            # even if we are interrupted; otherwise they'd leak into the pooled context.
+            for task in tasks:
+                task.cancel()
+            cleanup = asyncio.ensure_future(_close_pages(doc_pages))
+            _background_tasks.add(cleanup)
+            cleanup.add_done_callback(_background_tasks.discard)
+            await asyncio.shield(cleanup)
+
+
+async def fetch_docs(address: str) -> AsyncIterator[Tuple[str, bytes]]:
+    """
+    Yields (filename, PDF bytes) for each available document, serving from cache when possible.
+    """
+    key = _cache_key(address)
+    files = _docs_cache.get(key)
+    if files is not None:
+        for name, data in files.items():
+            yield name, data
+        return
 
-    if not files:
-        raise HTTPException(status_code=404, detail="No documents could be retrieved for that address.")
+    files = {}
+    complete = True
+    async for name, data in _scrape_docs(address):
+        if not data:
+            complete = False
+            continue
+        files[name] = data
+        yield name, data
 
-    # Make ZIP in memory
-    zip_buf = io.BytesIO()
-    with zipfile.ZipFile(zip_buf, "w", compression=zipfile.ZIP_DEFLATED) as z:
-        for name, data in files.items():
+    # Only cache a full set; a one-off failure should be retried next time
+    if files and complete:
+        try:
+            _docs_cache[key] = files
+        except ValueError:
+            # Larger than the whole cache; serve it uncached
+            pass
+
+
+class _ZipSink(io.RawIOBase):
+    """
+    Unseekable write target for ZipFile; lets us hand out ZIP bytes as they are produced.
+    """
+
+    def __init__(self) -> None:
+        self._chunks = []
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, b) -> int:
+        self._chunks.append(bytes(b))
+        return len(b)
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+async def _stream_zip(members: AsyncIterator[Tuple[str, bytes]]) -> AsyncIterator[bytes]:
+    sink = _ZipSink()
+    # PDFs are already flate-compressed internally; deflating them again is wasted CPU
+    with zipfile.ZipFile(sink, "w", compression=zipfile.ZIP_STORED) as z:
+        async for name, data in members:
             z.writestr(name, data)
-    return zip_buf.getvalue()
+            yield sink.drain()
+    # Central directory
+    yield sink.drain()
 
 
 @app.get("/", response_class=HTMLResponse)
@@ -300,10 +593,19 @@ async def download(address: str = Form(...)):
     if len(address) < 5:
         raise HTTPException(status_code=400, detail="Please provide a valid address.")
 
-    zip_bytes = await fetch_docs_as_zip(address)
+    docs = fetch_docs(address)
+    first = await anext(docs, None)
+    if first is None:
+        raise HTTPException(status_code=404, detail="No documents could be retrieved for that address.")
+
+    async def members() -> AsyncIterator[Tuple[str, bytes]]:
+        yield first
+        async for member in docs:
+            yield member
+
     fn = _safe_filename(address) + "__iredell_docs.zip"
     return StreamingResponse(
-        io.BytesIO(zip_bytes),
+        _stream_zip(members()),
         media_type="application/zip",
         headers={"Content-Disposition": f'attachment; filename="{fn}"'},
     )